@@ -5,9 +5,76 @@ from tensorflow import keras
 import cv2
 import time
 import random
+import threading
+import queue
+import os
+
+def load_representative_images(labels, samples_per_class=5):
+    """Load a few QuickDraw bitmaps per class (<label>.npy, as downloaded for training)"""
+    images = []
+    for label in labels:
+        filename = f"{label}.npy"
+        if os.path.exists(filename):
+            # Same normalization as the training notebook; memory-mapped so
+            # only the few samples used are read from the (large) file
+            samples = np.load(filename, mmap_mode='r')[:samples_per_class].astype('float32') / 255.0
+            images.extend(samples.reshape(-1, 28, 28, 1))
+    return images
+
+def tflite_quantization(representative_images):
+    """Name the quantization scheme used for the given calibration data"""
+    return 'int8' if representative_images else 'float16'
+
+def convert_to_tflite(model, tflite_path, representative_images):
+    """Convert a Keras model to a post-training quantized TFLite model"""
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    
+    if tflite_quantization(representative_images) == 'int8':
+        # Calibrate activation ranges for int8 quantization
+        def representative_dataset():
+            for image in representative_images:
+                yield [image[np.newaxis].astype(np.float32)]
+        converter.representative_dataset = representative_dataset
+    else:
+        # Without calibration data fall back to float16 weights, which need
+        # no activation ranges and lose less accuracy than int8 weights alone
+        converter.target_spec.supported_types = [tf.float16]
+        print("No representative data found, using float16 quantization")
+    
+    tflite_model = converter.convert()
+    
+    # Write to a temporary file first so a failed write never leaves a
+    # truncated model behind that would be picked up on the next launch
+    tmp_path = tflite_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(tflite_model)
+    os.replace(tmp_path, tflite_path)
+    
+    # Record the converter settings so a change to them triggers a reconversion
+    with open(tflite_path + '.quant', 'w') as f:
+        f.write(tflite_quantization(representative_images))
+    print(f"Converted model saved to {tflite_path}")
+
+def tflite_is_stale(model_path, tflite_path, quantization):
+    """Check whether the TFLite model is missing, outdated or built with other settings"""
+    if not os.path.exists(tflite_path):
+        return True
+    if not os.path.exists(model_path):
+        return False  # Nothing to reconvert from, keep using what is there
+    if os.path.getmtime(model_path) > os.path.getmtime(tflite_path):
+        return True
+    
+    # Files converted before the settings were recorded count as stale too
+    try:
+        with open(tflite_path + '.quant', 'r') as f:
+            return f.read().strip() != quantization
+    except OSError:
+        return True
 
 class QuickDrawGame:
-    def __init__(self, model_path='quickdraw_cnn_model.h5', labels_path='labels.txt'):
+    def __init__(self, model_path='quickdraw_cnn_model.h5', labels_path='labels.txt',
+                 tflite_path='quickdraw_cnn_model.tflite'):
         # Initialize Pygame
         pygame.init()
         
@@ -31,58 +98,133 @@ class QuickDrawGame:
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
+        self.text_cache = {}  # (text, font, color) -> rendered Surface
+        
+        # Static instructions are rendered once
+        instructions = [
+            "Draw with mouse",
+            "C - Clear canvas",
+            "SPACE - New word",
+            "D - Toggle debug",
+            "ESC - Menu"
+        ]
+        self.instruction_texts = [self.small_font.render(instruction, True, self.BLACK)
+                                  for instruction in instructions]
         
         # Canvas setup - white background for drawing
         self.canvas_x = 50
         self.canvas_y = 100
         self.canvas = pygame.Surface((self.CANVAS_SIZE, self.CANVAS_SIZE))
         self.canvas.fill(self.WHITE)  # White background
+        # Strokes are drawn into this grayscale array (255 = white, 0 = black),
+        # which feeds the model; self.canvas is only its on-screen copy
+        self.canvas_np = np.full((self.CANVAS_SIZE, self.CANVAS_SIZE), 255, dtype=np.uint8)
         self.drawing = False
         self.last_pos = None
         self.brush_size = 8  # Thicker brush for better visibility
+        self.dirty_bbox = None  # (x0, y0, x1, y1) around everything drawn, None if empty
+        
+        # A 28x28 CNN gains nothing from a thread per core - fewer threads
+        # keep synchronization overhead down and leave room for the game loop
+        self.inference_threads = 2
+        tf.get_logger().setLevel('ERROR')
+        try:
+            tf.config.threading.set_intra_op_parallelism_threads(self.inference_threads)
+            tf.config.threading.set_inter_op_parallelism_threads(1)
+        except RuntimeError:
+            # The TF runtime is already initialized (e.g. a second game in the
+            # same process) - its thread pools can no longer be changed
+            pass
         
         # Load model and labels
         try:
-            self.model = keras.models.load_model(model_path)
-            print(f"Model loaded successfully from {model_path}")
-            print(f"Model input shape: {self.model.input_shape}")
-            
             # Load labels
             with open(labels_path, 'r') as f:
                 self.labels = [line.strip() for line in f.readlines()]
             print(f"Loaded {len(self.labels)} labels: {self.labels}")
+            # Lowercased once so the per-frame win check needs no new strings
+            self.labels_lower = [label.lower() for label in self.labels]
+            
+            # Convert the Keras model to quantized TFLite on first run and
+            # whenever the .h5 has been replaced since
+            representative_images = load_representative_images(self.labels)
+            if tflite_is_stale(model_path, tflite_path, tflite_quantization(representative_images)):
+                model = keras.models.load_model(model_path)
+                print(f"Model loaded successfully from {model_path}")
+                convert_to_tflite(model, tflite_path, representative_images)
+            
+            self.interpreter = tf.lite.Interpreter(model_path=tflite_path, num_threads=self.inference_threads)
+            self.interpreter.allocate_tensors()
+            self.input_index = self.interpreter.get_input_details()[0]['index']
+            self.output_index = self.interpreter.get_output_details()[0]['index']
+            print(f"TFLite model loaded from {tflite_path}")
+            print(f"Model input shape: {self.interpreter.get_input_details()[0]['shape']}")
             
         except Exception as e:
             print(f"Error loading model or labels: {e}")
-            self.model = None
+            self.interpreter = None
             self.labels = []
+            self.labels_lower = []
         
         # Game state
         self.current_word = None
+        self.target_lower = None
         self.time_limit = 20  # seconds per word
         self.start_time = None
         self.score = 0
         self.game_state = "menu"  # menu, playing, gameover
-        self.prediction = None
-        self.confidence = 0
+        self.round_won = False
+        self.needs_redraw = True  # Menu and game over screens only redraw on change
+        # (label, lowercased label, confidence), replaced as a whole so the
+        # main thread never sees a label paired with another result's confidence
+        self.prediction_result = (None, None, 0)
         self.debug_mode = False  # Toggle with 'D' key
+        self.blur_input = True  # Toggle with 'B' key in debug mode to compare predictions
+        
+        # Background inference - the main loop hands over the latest canvas
+        # snapshot and the worker thread publishes the result under the lock
+        self.prediction_lock = threading.Lock()
+        self.inference_queue = queue.Queue(maxsize=1)  # Only the newest snapshot matters
+        self.inference_interval = 0.25  # Seconds between predictions during a drag
+        self.last_submit_time = 0
+        self.canvas_changed = False  # Set by new strokes, cleared once submitted
+        self.canvas_version = 0  # Bumped on clear so stale results get dropped
+        
+        # Preprocessing buffer reused by the worker for every prediction
+        size = self.MODEL_INPUT_SIZE
+        self.nn_input = np.empty((1, size, size, 1), dtype=np.float32)
+        # Separable 3x3 Gaussian (sigma 0.5); the vertical pass also scales by
+        # 1/255 so blurring and normalizing happen in a single filter
+        self.blur_kernel = cv2.getGaussianKernel(3, 0.5)
+        self.blur_kernel_scaled = self.blur_kernel / 255.0
+        self.inference_thread = threading.Thread(target=self.inference_worker, daemon=True)
+        self.inference_thread.start()
         
     def get_canvas_array(self):
-        """Convert pygame surface to numpy array matching training data format"""
-        # Get the canvas as a string buffer
-        canvas_string = pygame.image.tostring(self.canvas, 'RGB')
-        
-        # Convert to numpy array
-        canvas_array = np.frombuffer(canvas_string, dtype=np.uint8)
-        canvas_array = canvas_array.reshape((self.CANVAS_SIZE, self.CANVAS_SIZE, 3))
-        
-        # Convert to grayscale using the same method as OpenCV
-        # Use standard grayscale conversion: 0.299*R + 0.587*G + 0.114*B
-        gray = np.dot(canvas_array[...,:3], [0.299, 0.587, 0.114])
-        gray = gray.astype(np.uint8)
-        
-        # Resize to model input size
-        resized = cv2.resize(gray, (self.MODEL_INPUT_SIZE, self.MODEL_INPUT_SIZE), 
+        """Crop the drawn region and downscale it to match training data format"""
+        # QuickDraw bitmaps are centered and scaled to the drawing itself, so
+        # crop a square around the strokes with a little white padding
+        x0, y0, x1, y1 = self.dirty_bbox
+        side = int(max(x1 - x0, y1 - y0) * 1.2) + 1
+        left = (x0 + x1 - side) // 2
+        top = (y0 + y1 - side) // 2
+        crop = self.canvas_np[max(top, 0):top + side, max(left, 0):left + side]
+        
+        # Pad with white wherever the square reaches past the canvas edge
+        pad_top = max(-top, 0)
+        pad_left = max(-left, 0)
+        crop = cv2.copyMakeBorder(crop, pad_top, side - crop.shape[0] - pad_top,
+                                  pad_left, side - crop.shape[1] - pad_left,
+                                  cv2.BORDER_CONSTANT, value=255)
+        
+        # Halve with pyrDown while the crop is at least twice the model
+        # input, so the final area resize only covers a small ratio
+        while crop.shape[0] >= 2 * self.MODEL_INPUT_SIZE:
+            crop = cv2.pyrDown(crop)
+        
+        # The strokes are drawn into canvas_np, so no RGB readback or
+        # grayscale conversion is needed
+        resized = cv2.resize(crop, (self.MODEL_INPUT_SIZE, self.MODEL_INPUT_SIZE), 
                             interpolation=cv2.INTER_AREA)
         
         return resized
@@ -97,25 +239,23 @@ class QuickDrawGame:
         # Our canvas starts white (255) with black drawings (0)
         # This matches the QuickDraw format already!
         
-        # Create a copy to avoid modifying the original
-        processed = image_array.copy()
+        # Results are written into preallocated buffers, so the returned
+        # array is only valid until the next call
         
-        # Ensure the image has good contrast
-        # If the image is too uniform (user hasn't drawn much), skip processing
-        if np.std(processed) < 10:  # Very low variance means little/no drawing
-            # Return normalized empty canvas
-            processed = processed.astype('float32') / 255.0
-            processed = processed.reshape(1, 28, 28, 1)
-            return processed
+        # Model input viewed as a 2D image (batch_size=1, height=28, width=28, channels=1)
+        processed = self.nn_input
+        image_view = processed[0, :, :, 0]
         
-        # Apply slight Gaussian blur to smooth the lines (matching dataset characteristics)
-        processed = cv2.GaussianBlur(processed, (3, 3), 0.5)
+        # Empty canvases never get here - submit_prediction skips them
         
-        # Normalize to [0, 1] range
-        processed = processed.astype('float32') / 255.0
-        
-        # Reshape for model input (batch_size=1, height=28, width=28, channels=1)
-        processed = processed.reshape(1, 28, 28, 1)
+        if self.blur_input:
+            # Apply slight Gaussian blur to smooth the lines (matching dataset characteristics)
+            # and normalize to [0, 1] range, writing float32 straight into the model input
+            cv2.sepFilter2D(image_array, cv2.CV_32F, self.blur_kernel, self.blur_kernel_scaled,
+                            dst=image_view)
+        else:
+            # Strokes are already antialiased and downscaled, so just normalize
+            np.multiply(image_array, 1 / 255.0, out=image_view, dtype=np.float32)
         
         if self.debug_mode:
             # Debug: Print statistics
@@ -146,20 +286,19 @@ class QuickDrawGame:
         
         return processed
     
-    def predict_drawing(self):
-        """Make prediction on current drawing"""
-        if self.model is None:
+    def predict_drawing(self, canvas_array):
+        """Make prediction on a canvas snapshot from get_canvas_array"""
+        if self.interpreter is None:
             return None, 0
         
-        # Get canvas as numpy array
-        canvas_array = self.get_canvas_array()
-        
         # Preprocess for model
         processed = self.preprocess_for_model(canvas_array)
         
         # Make prediction
         try:
-            predictions = self.model.predict(processed, verbose=0)
+            self.interpreter.set_tensor(self.input_index, processed)
+            self.interpreter.invoke()
+            predictions = self.interpreter.get_tensor(self.output_index)
             
             # Get top prediction
             top_idx = np.argmax(predictions[0])
@@ -172,7 +311,9 @@ class QuickDrawGame:
             
             if self.debug_mode:
                 # Show top 3 predictions
-                top_3_idx = np.argsort(predictions[0])[-3:][::-1]
+                # argpartition finds the top 3 without sorting every class
+                top_3_idx = np.argpartition(predictions[0], -3)[-3:]
+                top_3_idx = top_3_idx[np.argsort(-predictions[0][top_3_idx])]
                 print("\nTop 3 predictions:")
                 for idx in top_3_idx:
                     if idx < len(self.labels):
@@ -184,20 +325,85 @@ class QuickDrawGame:
             print(f"Prediction error: {e}")
             return None, 0
     
+    def inference_worker(self):
+        """Run predictions on submitted canvas snapshots off the UI thread"""
+        while True:
+            version, canvas_array = self.inference_queue.get()
+            
+            # Keep the thread alive on errors, otherwise predictions would
+            # silently stop for the rest of the session
+            try:
+                label, confidence = self.predict_drawing(canvas_array)
+            except Exception as e:
+                print(f"Inference error: {e}")
+                continue
+            
+            with self.prediction_lock:
+                # Ignore results for a canvas that has been cleared meanwhile
+                if version == self.canvas_version:
+                    self.prediction_result = (label, label.lower() if label else None, confidence)
+    
+    def submit_prediction(self, force=False):
+        """Queue the current canvas for prediction, rate limited unless forced"""
+        if self.interpreter is None:
+            return
+        
+        # Nothing new drawn since the last prediction
+        if self.dirty_bbox is None or not self.canvas_changed:
+            return
+        
+        now = time.time()
+        if not force and now - self.last_submit_time < self.inference_interval:
+            return
+        self.last_submit_time = now
+        self.canvas_changed = False
+        
+        snapshot = (self.canvas_version, self.get_canvas_array())
+        
+        # Replace any snapshot the worker hasn't picked up yet
+        try:
+            self.inference_queue.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            self.inference_queue.put_nowait(snapshot)
+        except queue.Full:
+            pass
+    
+    def reset_prediction(self):
+        """Forget the current prediction and any in-flight results"""
+        with self.prediction_lock:
+            self.canvas_version += 1
+            self.prediction_result = (None, None, 0)
+    
+    def clear_canvas(self):
+        """Wipe the drawing and the prediction made from it"""
+        self.canvas.fill(self.WHITE)  # Clear canvas with white
+        self.canvas_np.fill(255)
+        self.dirty_bbox = None
+        self.canvas_changed = False
+        self.reset_prediction()
+    
     def start_new_round(self):
         """Start a new drawing round"""
-        self.canvas.fill(self.WHITE)  # Clear canvas with white
-        self.current_word = random.choice(self.labels) if self.labels else "cat"
+        self.clear_canvas()
+        if self.labels:
+            word_idx = random.randrange(len(self.labels))
+            self.current_word = self.labels[word_idx]
+            self.target_lower = self.labels_lower[word_idx]
+        else:
+            self.current_word = "cat"
+            self.target_lower = "cat"
         self.start_time = time.time()
         self.game_state = "playing"
-        self.prediction = None
-        self.confidence = 0
+        self.round_won = False
         print(f"\nNew round! Draw: {self.current_word}")
     
     def check_win_condition(self):
         """Check if player has won the round"""
-        if self.prediction and self.prediction.lower() == self.current_word.lower():
-            if self.confidence > 0.5:  # Require 50% confidence
+        _, prediction_lower, confidence = self.prediction_result
+        if prediction_lower and prediction_lower == self.target_lower:
+            if confidence > 0.5:  # Require 50% confidence
                 return True
         return False
     
@@ -223,43 +429,76 @@ class QuickDrawGame:
                 self.drawing = False
                 self.last_pos = None
                 
+                # Always predict the finished stroke, even if rate limited
+                self.submit_prediction(force=True)
+                
             elif event.type == pygame.MOUSEMOTION and self.drawing:
                 if self.last_pos:
-                    # Draw with black color on white canvas
-                    pygame.draw.line(self.canvas, self.BLACK, 
-                                   self.last_pos, (canvas_x, canvas_y), 
-                                   self.brush_size)
-                    # Also draw a circle for smoother lines
-                    pygame.draw.circle(self.canvas, self.BLACK, 
-                                     (canvas_x, canvas_y), 
-                                     self.brush_size // 2)
+                    # Draw with black color on white canvas - thick antialiased
+                    # lines have round caps, so no extra circle is needed
+                    cv2.line(self.canvas_np, self.last_pos, (canvas_x, canvas_y), 
+                            0, self.brush_size, lineType=cv2.LINE_AA)
+                    
+                    # Box around this segment, including the brush width
+                    radius = self.brush_size // 2 + 1
+                    seg_x0 = min(self.last_pos[0], canvas_x) - radius
+                    seg_y0 = min(self.last_pos[1], canvas_y) - radius
+                    seg_x1 = max(self.last_pos[0], canvas_x) + radius
+                    seg_y1 = max(self.last_pos[1], canvas_y) + radius
+                    
+                    # Copy just that box to the display surface through a view
+                    # of its pixels (surfarray is indexed x, y)
+                    left, top = max(seg_x0, 0), max(seg_y0, 0)
+                    right = min(seg_x1 + 1, self.CANVAS_SIZE)
+                    bottom = min(seg_y1 + 1, self.CANVAS_SIZE)
+                    pixels = pygame.surfarray.pixels3d(self.canvas)
+                    pixels[left:right, top:bottom] = self.canvas_np[top:bottom, left:right].T[..., np.newaxis]
+                    del pixels  # Releasing the view unlocks the surface
+                    
+                    # Grow the dirty box to cover this segment
+                    if self.dirty_bbox is None:
+                        self.dirty_bbox = (seg_x0, seg_y0, seg_x1, seg_y1)
+                    else:
+                        x0, y0, x1, y1 = self.dirty_bbox
+                        self.dirty_bbox = (min(x0, seg_x0), min(y0, seg_y0),
+                                           max(x1, seg_x1), max(y1, seg_y1))
+                    self.canvas_changed = True
                 self.last_pos = (canvas_x, canvas_y)
-                
-                # Make prediction while drawing
-                self.prediction, self.confidence = self.predict_drawing()
+    
+    def render_text(self, text, font, color):
+        """Render text once and reuse the Surface until the text changes"""
+        key = (text, id(font), color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            # Timer and confidence strings keep changing, so keep the cache bounded
+            if len(self.text_cache) > 256:
+                self.text_cache.clear()
+            surface = font.render(text, True, color)
+            self.text_cache[key] = surface
+        return surface
     
     def draw_menu(self):
         """Draw the main menu"""
         self.screen.fill(self.BLUE)
         
-        title = self.font.render("Quick, Draw! Clone", True, self.WHITE)
+        title = self.render_text("Quick, Draw! Clone", self.font, self.WHITE)
         title_rect = title.get_rect(center=(self.WINDOW_WIDTH//2, 150))
         self.screen.blit(title, title_rect)
         
-        if self.model:
-            start_text = self.font.render("Press SPACE to Start", True, self.WHITE)
+        if self.interpreter:
+            start_text = self.render_text("Press SPACE to Start", self.font, self.WHITE)
             start_rect = start_text.get_rect(center=(self.WINDOW_WIDTH//2, 300))
             self.screen.blit(start_text, start_rect)
             
-            info_text = self.small_font.render(f"Model loaded with {len(self.labels)} categories", True, self.WHITE)
+            info_text = self.render_text(f"Model loaded with {len(self.labels)} categories", self.small_font, self.WHITE)
             info_rect = info_text.get_rect(center=(self.WINDOW_WIDTH//2, 350))
             self.screen.blit(info_text, info_rect)
         else:
-            error_text = self.font.render("Model not loaded!", True, self.RED)
+            error_text = self.render_text("Model not loaded!", self.font, self.RED)
             error_rect = error_text.get_rect(center=(self.WINDOW_WIDTH//2, 300))
             self.screen.blit(error_text, error_rect)
         
-        quit_text = self.small_font.render("Press Q to Quit", True, self.WHITE)
+        quit_text = self.render_text("Press Q to Quit", self.small_font, self.WHITE)
         quit_rect = quit_text.get_rect(center=(self.WINDOW_WIDTH//2, 450))
         self.screen.blit(quit_text, quit_rect)
     
@@ -274,7 +513,7 @@ class QuickDrawGame:
         self.screen.blit(self.canvas, (self.canvas_x, self.canvas_y))
         
         # Draw current word
-        word_text = self.font.render(f"Draw: {self.current_word}", True, self.BLACK)
+        word_text = self.render_text(f"Draw: {self.current_word}", self.font, self.BLACK)
         self.screen.blit(word_text, (self.canvas_x, 40))
         
         # Draw timer
@@ -282,7 +521,7 @@ class QuickDrawGame:
             elapsed = time.time() - self.start_time
             remaining = max(0, self.time_limit - elapsed)
             timer_color = self.RED if remaining < 5 else self.BLACK
-            timer_text = self.font.render(f"Time: {remaining:.1f}s", True, timer_color)
+            timer_text = self.render_text(f"Time: {remaining:.1f}s", self.font, timer_color)
             self.screen.blit(timer_text, (self.canvas_x + 300, 40))
             
             # Check if time's up
@@ -290,54 +529,46 @@ class QuickDrawGame:
                 self.game_state = "gameover"
         
         # Draw prediction
-        if self.prediction:
+        prediction, _, confidence = self.prediction_result
+        if prediction:
             pred_color = self.GREEN if self.check_win_condition() else self.BLACK
-            pred_text = self.small_font.render(
-                f"I think it's: {self.prediction} ({self.confidence:.1%})", 
-                True, pred_color)
+            pred_text = self.render_text(
+                f"I think it's: {prediction} ({confidence:.1%})", 
+                self.small_font, pred_color)
             self.screen.blit(pred_text, (self.canvas_x, self.canvas_y + self.CANVAS_SIZE + 20))
         
         # Draw score
-        score_text = self.font.render(f"Score: {self.score}", True, self.BLACK)
+        score_text = self.render_text(f"Score: {self.score}", self.font, self.BLACK)
         self.screen.blit(score_text, (self.WINDOW_WIDTH - 200, 40))
         
         # Draw instructions
-        instructions = [
-            "Draw with mouse",
-            "C - Clear canvas",
-            "SPACE - New word",
-            "D - Toggle debug",
-            "ESC - Menu"
-        ]
         y_offset = 150
-        for instruction in instructions:
-            inst_text = self.small_font.render(instruction, True, self.BLACK)
+        for inst_text in self.instruction_texts:
             self.screen.blit(inst_text, (self.CANVAS_SIZE + 100, y_offset))
             y_offset += 30
         
         # Draw debug mode indicator
         if self.debug_mode:
-            debug_text = self.small_font.render("DEBUG MODE ON", True, self.RED)
+            debug_text = self.render_text("DEBUG MODE ON", self.small_font, self.RED)
             self.screen.blit(debug_text, (self.CANVAS_SIZE + 100, y_offset + 30))
     
     def draw_gameover(self):
         """Draw game over screen"""
         self.screen.fill(self.BLUE)
         
-        if self.check_win_condition():
-            result_text = self.font.render("You Won!", True, self.GREEN)
-            self.score += 1
+        if self.round_won:
+            result_text = self.render_text("You Won!", self.font, self.GREEN)
         else:
-            result_text = self.font.render("Time's Up!", True, self.RED)
+            result_text = self.render_text("Time's Up!", self.font, self.RED)
         
         result_rect = result_text.get_rect(center=(self.WINDOW_WIDTH//2, 200))
         self.screen.blit(result_text, result_rect)
         
-        score_text = self.font.render(f"Score: {self.score}", True, self.WHITE)
+        score_text = self.render_text(f"Score: {self.score}", self.font, self.WHITE)
         score_rect = score_text.get_rect(center=(self.WINDOW_WIDTH//2, 300))
         self.screen.blit(score_text, score_rect)
         
-        continue_text = self.small_font.render("Press SPACE for next round or ESC for menu", True, self.WHITE)
+        continue_text = self.render_text("Press SPACE for next round or ESC for menu", self.small_font, self.WHITE)
         continue_rect = continue_text.get_rect(center=(self.WINDOW_WIDTH//2, 400))
         self.screen.blit(continue_text, continue_rect)
     
@@ -348,6 +579,9 @@ class QuickDrawGame:
         while running:
             # Handle events
             for event in pygame.event.get():
+                # Any input may change what is on screen
+                self.needs_redraw = True
+                
                 if event.type == pygame.QUIT:
                     running = False
                 
@@ -359,7 +593,7 @@ class QuickDrawGame:
                         self.game_state = "menu"
                     
                     elif event.key == pygame.K_SPACE:
-                        if self.game_state == "menu" and self.model:
+                        if self.game_state == "menu" and self.interpreter:
                             self.start_new_round()
                         elif self.game_state == "gameover":
                             self.start_new_round()
@@ -368,32 +602,51 @@ class QuickDrawGame:
                     
                     elif event.key == pygame.K_c and self.game_state == "playing":
                         # Clear canvas
-                        self.canvas.fill(self.WHITE)
-                        self.prediction = None
-                        self.confidence = 0
+                        self.clear_canvas()
                     
                     elif event.key == pygame.K_d:
                         # Toggle debug mode
                         self.debug_mode = not self.debug_mode
                         print(f"Debug mode: {'ON' if self.debug_mode else 'OFF'}")
+                    
+                    elif event.key == pygame.K_b and self.debug_mode:
+                        # Toggle input blur (debug only, for A/B testing)
+                        self.blur_input = not self.blur_input
+                        print(f"Input blur: {'ON' if self.blur_input else 'OFF'}")
                 
                 # Handle mouse events for drawing
                 self.handle_mouse_events(event)
             
-            # Draw appropriate screen
-            if self.game_state == "menu":
-                self.draw_menu()
-            elif self.game_state == "playing":
-                self.draw_game()
-                # Check win condition continuously
-                if self.check_win_condition():
-                    self.game_state = "gameover"
-            elif self.game_state == "gameover":
-                self.draw_gameover()
+            # The game screen has a running timer and background predictions,
+            # the other screens only change on input
+            if self.needs_redraw or self.game_state == "playing":
+                drawn_state = self.game_state
+                
+                # Draw appropriate screen
+                if self.game_state == "menu":
+                    self.draw_menu()
+                elif self.game_state == "playing":
+                    # Coarse periodic prediction during a long drag; finished
+                    # strokes are predicted on MOUSEBUTTONUP
+                    if self.drawing:
+                        self.submit_prediction()
+                    self.draw_game()
+                    # Check win condition continuously
+                    if self.check_win_condition():
+                        self.game_state = "gameover"
+                        self.round_won = True
+                        self.score += 1
+                elif self.game_state == "gameover":
+                    self.draw_gameover()
+                
+                # Update display
+                pygame.display.flip()
+                
+                # Draw the next screen right away if this frame switched to it
+                self.needs_redraw = self.game_state != drawn_state
             
-            # Update display
-            pygame.display.flip()
-            self.clock.tick(60)  # 60 FPS
+            # 60 FPS while playing, idle screens can tick slower
+            self.clock.tick(60 if self.game_state == "playing" else 30)
         
         pygame.quit()
 